@@ -6,10 +6,15 @@ AI agents (LangChain, LlamaIndex, CrewAI, AutoGen, etc.).
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from operator import attrgetter
+from typing import Any, Iterator, Optional
 
 from chitin.client import ChitinClient
 
+# SearchResult -> recall() dict projection, evaluated in C by attrgetter.
+_RECALL_KEYS = ("polyp_id", "text", "similarity", "trust_score", "state")
+_RECALL_GET = attrgetter("polyp_id", "payload.content", "similarity", "trust_score", "state")
+
 
 class ChitinMemory:
     """High-level memory interface for AI agents.
@@ -26,11 +31,14 @@ class ChitinMemory:
         memory.forget(polyp_id)
     """
 
+    __slots__ = ("_client", "_default_model", "_owns_client")
+
     def __init__(
         self,
         host: str = "localhost",
         port: int = 50051,
         default_model: Optional[str] = None,
+        client: Optional[ChitinClient] = None,
     ) -> None:
         """Initialize ChitinMemory.
 
@@ -38,9 +46,18 @@ class ChitinMemory:
             host: Hostname of the chitin-daemon.
             port: gRPC port of the chitin-daemon.
             default_model: Default embedding model ID. None uses daemon default.
+            client: Existing connected client to reuse. The caller keeps
+                ownership: it is not connected or closed by ChitinMemory,
+                and host/port are ignored.
         """
-        self._client = ChitinClient(host=host, port=port)
-        self._client.connect()
+        # An owned client needs no finalizer here: if this object is
+        # collected unclosed, so is the client, whose own finalizer
+        # releases the shared channel.
+        self._owns_client = client is None
+        if client is None:
+            client = ChitinClient(host=host, port=port)
+            client.connect()
+        self._client = client
         self._default_model = default_model
 
     def remember(
@@ -92,16 +109,31 @@ class ChitinMemory:
             top_k=top_k,
             model_id=self._default_model,
         )
-        return [
-            {
-                "polyp_id": r.polyp_id,
-                "text": r.payload.content,
-                "similarity": r.similarity,
-                "trust_score": r.trust_score,
-                "state": r.state,
-            }
-            for r in results
-        ]
+        return [dict(zip(_RECALL_KEYS, _RECALL_GET(r))) for r in results]
+
+    def recall_iter(
+        self,
+        query: str,
+        top_k: int = 5,
+    ) -> Iterator[dict[str, Any]]:
+        """Search the Reef, yielding results as they arrive.
+
+        Same result dictionaries as recall(), but streamed so callers
+        can start using the best matches before all top_k have arrived.
+
+        Args:
+            query: Natural language query.
+            top_k: Maximum number of results.
+
+        Yields:
+            Result dictionaries with the same keys as recall().
+        """
+        for r in self._client.search_iter(
+            query=query,
+            top_k=top_k,
+            model_id=self._default_model,
+        ):
+            yield dict(zip(_RECALL_KEYS, _RECALL_GET(r)))
 
     def forget(self, polyp_id: str) -> bool:
         """Delete a Polyp from the local store.
@@ -121,12 +153,6 @@ class ChitinMemory:
         return False
 
     def close(self) -> None:
-        """Close the underlying client connection."""
-        self._client.close()
-
-    def __del__(self) -> None:
-        """Cleanup on garbage collection."""
-        try:
-            self.close()
-        except Exception:
-            pass
+        """Close the underlying client connection, unless it was injected."""
+        if self._owns_client:
+            self._client.close()
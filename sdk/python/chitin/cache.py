@@ -0,0 +1,169 @@
+"""Client-side search result cache.
+
+Two layers sit in front of ChitinClient.search:
+- an exact-match LRU keyed on (query, scope), and
+- an optional semantic layer that serves paraphrased queries whose
+  embeddings are close to a previously seen query.
+
+The semantic layer only runs when an embedder callable is supplied,
+so the SDK does not depend on any particular embedding library.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+import numpy as np
+
+from chitin.types import SearchResult
+
+
+class SemanticSearchCache:
+    """Exact + semantic cache of search results.
+
+    An entry cached for top_k=N can serve any request with top_k <= N
+    and the same scope. The scope is any hashable describing the rest
+    of the search (model, collection, thresholds).
+    Entries expire after ``ttl`` seconds so results from other nodes
+    eventually become visible.
+
+    Usage:
+        cache = SemanticSearchCache(embedder=model.encode)
+        results = cache.get("how fast is light?", top_k=5)
+        if results is None:
+            results = daemon_search(...)
+            cache.put("how fast is light?", 5, None, results)
+    """
+
+    def __init__(
+        self,
+        max_exact: int = 1024,
+        max_semantic: int = 1024,
+        threshold: float = 0.95,
+        ttl: float = 60.0,
+        embedder: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_exact: Maximum entries in the exact-match LRU.
+            max_semantic: Maximum entries in the semantic layer (FIFO).
+            threshold: Minimum cosine similarity for a semantic hit.
+            ttl: Seconds an entry stays valid.
+            embedder: Callable mapping query text to a vector. None
+                disables the semantic layer.
+        """
+        self._max_exact = max_exact
+        self._max_semantic = max_semantic
+        self._threshold = threshold
+        self._ttl = ttl
+        self._embedder = embedder
+        self._lock = threading.Lock()
+        # (query, scope) -> (stored_at, top_k, results)
+        self._exact: OrderedDict[tuple[str, Hashable], tuple[float, int, list[SearchResult]]] = OrderedDict()
+        # Semantic layer: ring buffer of normalized query embeddings with
+        # parallel (stored_at, scope, top_k, results) entries.
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: list[tuple[float, Hashable, int, list[SearchResult]]] = []
+        self._next_slot = 0
+        self._last_embedding: Optional[tuple[str, np.ndarray]] = None
+
+    def get(
+        self,
+        query: str,
+        top_k: int,
+        scope: Hashable = None,
+    ) -> Optional[list[SearchResult]]:
+        """Look up cached results for a query.
+
+        Returns:
+            The cached results truncated to top_k, or None on a miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            key = (query, scope)
+            hit = self._exact.get(key)
+            if hit is not None:
+                stored_at, cached_k, results = hit
+                if now - stored_at > self._ttl:
+                    del self._exact[key]
+                elif cached_k >= top_k:
+                    self._exact.move_to_end(key)
+                    return results[:top_k]
+
+            if self._embedder is None or self._vectors is None or not self._entries:
+                return None
+
+        # Embed outside the lock so a slow embedder does not serialize
+        # concurrent lookups.
+        vec = self._embed(query)
+        with self._lock:
+            if self._vectors is None or not self._entries:
+                return None
+            sims = self._vectors[: len(self._entries)] @ vec
+            for idx in np.argsort(sims)[::-1]:
+                if sims[idx] < self._threshold:
+                    break
+                stored_at, entry_scope, cached_k, results = self._entries[idx]
+                if now - stored_at <= self._ttl and entry_scope == scope and cached_k >= top_k:
+                    return results[:top_k]
+            return None
+
+    def put(
+        self,
+        query: str,
+        top_k: int,
+        scope: Hashable,
+        results: list[SearchResult],
+    ) -> None:
+        """Store the results of a daemon search."""
+        now = time.monotonic()
+        with self._lock:
+            key = (query, scope)
+            self._exact[key] = (now, top_k, results)
+            self._exact.move_to_end(key)
+            while len(self._exact) > self._max_exact:
+                self._exact.popitem(last=False)
+
+        if self._embedder is None or self._max_semantic <= 0:
+            return
+        vec = self._embed(query)
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self._max_semantic, vec.shape[0]), dtype=np.float32)
+            slot = self._next_slot
+            self._vectors[slot] = vec
+            entry = (now, scope, top_k, results)
+            if slot < len(self._entries):
+                self._entries[slot] = entry
+            else:
+                self._entries.append(entry)
+            self._next_slot = (slot + 1) % self._max_semantic
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._exact.clear()
+            self._entries.clear()
+            self._next_slot = 0
+
+    def _embed(self, query: str) -> np.ndarray:
+        """Embed and L2-normalize a query, reusing the last embedding.
+
+        get() followed by put() for the same query embeds only once.
+        Called without the lock held; the memo is a single tuple that is
+        read and replaced atomically.
+        """
+        last = self._last_embedding
+        if last is not None and last[0] == query:
+            return last[1]
+        assert self._embedder is not None
+        vec = np.asarray(self._embedder(query), dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vec))
+        if norm > 0.0:
+            vec = vec / norm
+        self._last_embedding = (query, vec)
+        return vec
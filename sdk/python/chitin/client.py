@@ -1,15 +1,168 @@
 """gRPC client for the Chitin Protocol daemon.
 
 Provides a Python interface to the chitin-daemon's gRPC API.
-Phase 1: All methods are stubs with placeholder returns.
+Phase 1: RPC methods are stubs with placeholder returns.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import json
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Optional
 
+import grpc
+import msgspec
+
+from chitin.cache import SemanticSearchCache
 from chitin.types import Polyp, SearchResult
 
+# Process-wide channel cache keyed by (host, port). Every ChitinClient
+# pointed at the same daemon multiplexes over one HTTP/2 connection; the
+# channel is closed when the last client referencing it is closed.
+_CHANNEL_CACHE: dict[tuple[str, int], grpc.Channel] = {}
+_CHANNEL_REFS: dict[tuple[str, int], int] = {}
+_CHANNEL_LOCK = threading.Lock()
+# Channel releases waiting for _CHANNEL_LOCK. A client's finalizer can run
+# inside a GC pass on a thread that already holds the lock, so releases
+# are queued and applied by whichever caller next gets the lock.
+_PENDING_RELEASES: deque[tuple[str, int]] = deque()
+
+# Process-wide search caches keyed by (host, port, query_embedder), so
+# every client of a daemon reads the same cached results. A write
+# through any client clears all caches for that daemon.
+_SEARCH_CACHES: dict[tuple[str, int, Optional[Callable[[str], Any]]], SemanticSearchCache] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+# Retry transient overload/unavailability on every daemon method.
+_SERVICE_CONFIG = {
+    "methodConfig": [
+        {
+            "name": [{"service": "chitin.rpc.ChitinService"}],
+            "retryPolicy": {
+                "maxAttempts": 3,
+                "initialBackoff": "0.1s",
+                "maxBackoff": "1s",
+                "backoffMultiplier": 2,
+                "retryableStatusCodes": ["UNAVAILABLE", "RESOURCE_EXHAUSTED"],
+            },
+        }
+    ]
+}
+
+_CHANNEL_OPTIONS = [
+    # Large top_k search responses carry full payload text.
+    ("grpc.max_send_message_length", 64 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+    # Keep idle connections alive between bursts instead of reconnecting.
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.enable_retries", 1),
+    ("grpc.service_config", json.dumps(_SERVICE_CONFIG)),
+]
+
+
+class _RpcRequest(msgspec.Struct, gc=False):
+    """Request envelope accepted by the daemon's chitin.rpc.ChitinService."""
+    method: str
+    params: msgspec.Struct
+
+
+class _SubmitPolypParams(msgspec.Struct, gc=False):
+    """Params for the daemon's polyp/submit method.
+
+    content_type is required by the daemon, so defaults are always sent.
+    """
+    content: str
+    content_type: str = "text/plain"
+
+
+class _SearchParams(msgspec.Struct, omit_defaults=True, gc=False):
+    """Params for the daemon's query/search method."""
+    query_text: str
+    top_k: int = 10
+    model_id: Optional[str] = None
+    reef_zone: Optional[str] = None
+    similarity_threshold: Optional[float] = None
+    hnsw_ef: Optional[int] = None
+
+
+# msgspec encoders are thread-safe, so one instance serves every client.
+_REQUEST_ENCODER = msgspec.json.Encoder()
+
+
+def _acquire_channel(host: str, port: int) -> grpc.Channel:
+    """Return the shared channel for (host, port), creating it if needed."""
+    key = (host, port)
+    with _CHANNEL_LOCK:
+        channel = _CHANNEL_CACHE.get(key)
+        if channel is None:
+            channel = grpc.insecure_channel(f"{host}:{port}", options=_CHANNEL_OPTIONS)
+            _CHANNEL_CACHE[key] = channel
+        _CHANNEL_REFS[key] = _CHANNEL_REFS.get(key, 0) + 1
+    _drain_pending_releases()
+    return channel
+
+
+def _release_channel(host: str, port: int) -> None:
+    """Drop one reference to the shared channel, closing it on the last release.
+
+    Safe to call from a weakref finalizer: if the lock is held, possibly
+    by this very thread, the release is left queued for the holder.
+    """
+    _PENDING_RELEASES.append((host, port))
+    _drain_pending_releases()
+
+
+def _drain_pending_releases() -> None:
+    """Apply queued channel releases if _CHANNEL_LOCK is free."""
+    while _PENDING_RELEASES:
+        if not _CHANNEL_LOCK.acquire(blocking=False):
+            # The holder drains the queue after it releases the lock.
+            return
+        closing = []
+        try:
+            while _PENDING_RELEASES:
+                key = _PENDING_RELEASES.popleft()
+                refs = _CHANNEL_REFS.get(key, 0) - 1
+                if refs > 0:
+                    _CHANNEL_REFS[key] = refs
+                    continue
+                _CHANNEL_REFS.pop(key, None)
+                channel = _CHANNEL_CACHE.pop(key, None)
+                if channel is not None:
+                    closing.append(channel)
+        finally:
+            _CHANNEL_LOCK.release()
+        for channel in closing:
+            channel.close()
+
+
+def _shared_search_cache(
+    host: str, port: int, embedder: Optional[Callable[[str], Any]]
+) -> SemanticSearchCache:
+    """Return the search cache shared by clients of (host, port)."""
+    key = (host, port, embedder)
+    with _SEARCH_CACHE_LOCK:
+        cache = _SEARCH_CACHES.get(key)
+        if cache is None:
+            cache = _SEARCH_CACHES[key] = SemanticSearchCache(embedder=embedder)
+        return cache
+
+
+def _invalidate_search_caches(host: str, port: int) -> None:
+    """Clear every search cache for (host, port) after a write."""
+    with _SEARCH_CACHE_LOCK:
+        caches = [c for (h, p, _), c in _SEARCH_CACHES.items() if h == host and p == port]
+    for cache in caches:
+        cache.clear()
+
 
 class ChitinClient:
     """Client for interacting with a chitin-daemon node via gRPC.
@@ -23,17 +176,59 @@ class ChitinClient:
     integration will be added when the daemon is running.
     """
 
-    def __init__(self, host: str = "localhost", port: int = 50051) -> None:
+    __slots__ = (
+        "host",
+        "port",
+        "_channel",
+        "_connected",
+        "_cache",
+        "_finalizer",
+        "_node_info",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 50051,
+        enable_cache: bool = True,
+        query_embedder: Optional[Callable[[str], Any]] = None,
+    ) -> None:
         """Initialize the Chitin client.
 
         Args:
             host: Hostname or IP of the chitin-daemon.
             port: gRPC port of the chitin-daemon.
+            enable_cache: Cache search results client-side. The cache
+                is shared by all clients of the same daemon.
+            query_embedder: Optional local embedding function. When set,
+                the cache also serves paraphrased queries.
         """
         self.host = host
         self.port = port
         self._channel = None
         self._connected = False
+        self._finalizer: Optional[weakref.finalize] = None
+        # (monotonic fetch time, daemon-reported node info)
+        self._node_info: Optional[tuple[float, dict]] = None
+        self._cache = _shared_search_cache(host, port, query_embedder) if enable_cache else None
+
+    @classmethod
+    def from_env(cls) -> "ChitinClient":
+        """Return the process-wide shared client for the configured daemon.
+
+        Reads CHITIN_HOST and CHITIN_PORT (defaulting to localhost:50051).
+        Every call with the same settings returns the same connected
+        client, so high-level objects built on it share one channel.
+        The shared client is owned by the process; callers should not
+        close it.
+        """
+        host = os.environ.get("CHITIN_HOST", "localhost")
+        port = int(os.environ.get("CHITIN_PORT", "50051"))
+        client = _shared_client(host, port)
+        if not client._connected:
+            client.connect()
+        return client
 
     def __enter__(self) -> "ChitinClient":
         """Enter context manager — connect to daemon."""
@@ -47,18 +242,27 @@ class ChitinClient:
     def connect(self) -> None:
         """Establish gRPC connection to the daemon.
 
-        Phase 1: No-op placeholder.
+        Channels are shared process-wide per (host, port), so connecting
+        several clients to the same daemon opens a single connection.
+        gRPC channels connect lazily; no I/O happens until the first RPC.
         """
-        # Phase 2: self._channel = grpc.insecure_channel(f"{self.host}:{self.port}")
+        if self._channel is None:
+            self._channel = _acquire_channel(self.host, self.port)
+            # Release the channel reference if the client is collected
+            # without being closed.
+            self._finalizer = weakref.finalize(self, _release_channel, self.host, self.port)
         self._connected = True
 
     def close(self) -> None:
-        """Close the gRPC connection.
+        """Release this client's reference to the shared gRPC channel.
 
-        Phase 1: No-op placeholder.
+        The underlying channel is only closed once no other client uses it.
         """
-        # Phase 2: if self._channel: self._channel.close()
+        if self._finalizer is not None:
+            self._finalizer()
+            self._finalizer = None
         self._connected = False
+        self._node_info = None
         self._channel = None
 
     def submit_polyp(
@@ -84,9 +288,58 @@ class ChitinClient:
             The UUID of the created Polyp.
         """
         # Phase 1: Placeholder — returns a mock UUID
-        # Phase 2: Call SubmitPolyp gRPC endpoint
+        # Phase 2: Call SubmitPolyp gRPC endpoint with
+        # self._encode_request("polyp/submit", _SubmitPolypParams(...))
+        self._invalidate_cache()
         return "00000000-0000-0000-0000-000000000000"
 
+    async def submit_polyp_async(
+        self,
+        text: str,
+        content_type: str = "text/plain",
+        model_id: Optional[str] = None,
+    ) -> str:
+        """Async variant of submit_polyp.
+
+        Many concurrent calls are multiplexed as separate HTTP/2 streams
+        over the shared connection.
+
+        Args:
+            text: The knowledge text to embed and submit.
+            content_type: MIME type of the content.
+            model_id: Embedding model to use (None = daemon default).
+
+        Returns:
+            The UUID of the created Polyp.
+        """
+        # Phase 1: Placeholder — returns a mock UUID
+        # Phase 2: Call SubmitPolyp via a grpc.aio channel
+        self._invalidate_cache()
+        return "00000000-0000-0000-0000-000000000000"
+
+    def submit_polyps_batch(
+        self,
+        items: Iterable[tuple[str, str, Optional[str]]],
+    ) -> list[str]:
+        """Submit several Polyps in a single round-trip.
+
+        Equivalent to calling submit_polyp once per item, but the whole
+        batch travels over one client-streaming call instead of N unary
+        calls.
+
+        Args:
+            items: (text, content_type, model_id) tuples; model_id may be
+                None to use the daemon default.
+
+        Returns:
+            The UUIDs of the created Polyps, in input order.
+        """
+        # Phase 1: Placeholder — returns one mock UUID per item
+        # Phase 2: Call SubmitPolypStream client-streaming gRPC endpoint
+        ids = ["00000000-0000-0000-0000-000000000000" for _ in items]
+        self._invalidate_cache()
+        return ids
+
     def get_polyp(self, polyp_id: str) -> Polyp:
         """Retrieve a Polyp by its UUID.
 
@@ -107,6 +360,9 @@ class ChitinClient:
         query: str,
         top_k: int = 10,
         model_id: Optional[str] = None,
+        collection: Optional[str] = None,
+        similarity_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
     ) -> list[SearchResult]:
         """Perform semantic search over the Reef.
 
@@ -114,27 +370,110 @@ class ChitinClient:
             query: Natural language query text.
             top_k: Maximum number of results to return.
             model_id: Embedding model space to search (None = default).
+            collection: Reef Zone to restrict the search to, letting the
+                daemon skip unrelated index shards (None = whole Reef).
+            similarity_threshold: Drop results below this similarity
+                on the daemon side (None = no cutoff).
+            hnsw_ef: HNSW search breadth; higher trades latency for
+                recall (None = daemon default).
 
         Returns:
             List of SearchResult objects ordered by similarity.
         """
-        # Phase 1: Placeholder — returns empty results
-        # Phase 2: Call SemanticSearch gRPC endpoint
-        return []
+        return list(
+            self.search_iter(
+                query, top_k, model_id, collection, similarity_threshold, hnsw_ef
+            )
+        )
 
-    def get_node_info(self) -> dict:
+    def search_iter(
+        self,
+        query: str,
+        top_k: int = 10,
+        model_id: Optional[str] = None,
+        collection: Optional[str] = None,
+        similarity_threshold: Optional[float] = None,
+        hnsw_ef: Optional[int] = None,
+    ) -> Iterator[SearchResult]:
+        """Perform semantic search, yielding results as they arrive.
+
+        Backed by a server-streaming call, so the first result is
+        available before the rest have been sent. Results are cached
+        only if the iterator is fully consumed.
+
+        Args:
+            query: Natural language query text.
+            top_k: Maximum number of results to return.
+            model_id: Embedding model space to search (None = default).
+            collection: Reef Zone to restrict the search to (None = whole Reef).
+            similarity_threshold: Daemon-side similarity cutoff (None = none).
+            hnsw_ef: HNSW search breadth (None = daemon default).
+
+        Yields:
+            SearchResult objects ordered by similarity.
+        """
+        scope = (model_id, collection, similarity_threshold, hnsw_ef)
+        if self._cache is not None:
+            cached = self._cache.get(query, top_k, scope)
+            if cached is not None:
+                yield from cached
+                return
+        # Phase 1: Placeholder — yields no results
+        # Phase 2: Iterate the SemanticSearch server-streaming gRPC endpoint with
+        # self._encode_request("query/search", _SearchParams(...))
+        stream: Iterator[SearchResult] = iter(())
+        results: list[SearchResult] = []
+        for result in stream:
+            results.append(result)
+            yield result
+        if self._cache is not None:
+            self._cache.put(query, top_k, scope, results)
+
+    def _encode_request(self, method: str, params: msgspec.Struct) -> bytes:
+        """Serialize a daemon request envelope."""
+        return _REQUEST_ENCODER.encode(_RpcRequest(method, params))
+
+    def _invalidate_cache(self) -> None:
+        """Drop cached search results after this client writes to the Reef."""
+        if self._cache is not None:
+            _invalidate_search_caches(self.host, self.port)
+
+    def get_node_info(self, ttl: float = 60.0) -> dict:
         """Get information about the connected node.
 
+        Daemon-reported fields are cached for ``ttl`` seconds; uptime is
+        advanced locally between fetches, and connection fields always
+        reflect the current client state.
+
+        Args:
+            ttl: Maximum age in seconds of the cached daemon response.
+
         Returns:
             Dictionary with node type, version, uptime, capabilities.
         """
-        # Phase 1: Placeholder
-        # Phase 2: Call GetNodeInfo gRPC endpoint
+        now = time.monotonic()
+        if self._node_info is None or now - self._node_info[0] >= ttl:
+            # Phase 1: Placeholder
+            # Phase 2: Call GetNodeInfo gRPC endpoint
+            self._node_info = (
+                now,
+                {
+                    "node_type": "hybrid",
+                    "version": "0.1.0",
+                    "uptime_seconds": 0,
+                },
+            )
+        fetched_at, info = self._node_info
         return {
-            "node_type": "hybrid",
-            "version": "0.1.0",
-            "uptime_seconds": 0,
+            **info,
+            "uptime_seconds": info["uptime_seconds"] + int(now - fetched_at),
             "connected": self._connected,
             "host": self.host,
             "port": self.port,
         }
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_client(host: str, port: int) -> ChitinClient:
+    """Construct the memoized client backing ChitinClient.from_env."""
+    return ChitinClient(host=host, port=port)
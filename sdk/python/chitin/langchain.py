@@ -10,11 +10,52 @@ is optional and may not be installed.
 
 from __future__ import annotations
 
-from typing import Any, Iterable, Optional
+import asyncio
+from operator import attrgetter
+from typing import Any, Iterable, Iterator, Optional
+
+import msgspec
 
 from chitin.client import ChitinClient
 from chitin.types import SearchResult
 
+# Maximum number of texts sent per submit_polyps_batch call.
+_SUBMIT_BATCH_SIZE = 256
+
+# Maximum number of in-flight submit_polyp_async calls per aadd_texts call,
+# kept below the daemon's HTTP/2 MAX_CONCURRENT_STREAMS.
+_MAX_CONCURRENT_SUBMITS = 64
+
+# SearchResult -> document metadata projections, evaluated in C by attrgetter.
+# similarity_search_with_score returns similarity alongside the document,
+# so its metadata omits it.
+_METADATA_KEYS = (
+    "polyp_id", "cid", "similarity", "trust_score", "creator_did", "state", "hardened_epoch",
+)
+_METADATA_GET = attrgetter(*_METADATA_KEYS)
+_SCORED_METADATA_KEYS = tuple(k for k in _METADATA_KEYS if k != "similarity")
+_SCORED_METADATA_GET = attrgetter(*_SCORED_METADATA_KEYS)
+
+# Shared JSON encoder for search results; reusing one avoids per-call setup.
+_JSON_ENCODER = msgspec.json.Encoder()
+
+
+def encode_results(results: Any) -> bytes:
+    """Encode similarity_search* output as JSON bytes.
+
+    Use this instead of json.dumps when handing results to tool outputs,
+    caches, or tracing layers; it produces the same JSON with less
+    overhead.
+
+    Args:
+        results: Return value of similarity_search or
+            similarity_search_with_score.
+
+    Returns:
+        UTF-8 encoded JSON.
+    """
+    return _JSON_ENCODER.encode(results)
+
 
 class ChitinVectorStore:
     """LangChain VectorStore adapter for the Chitin Reef.
@@ -28,12 +69,15 @@ class ChitinVectorStore:
         results = store.similarity_search("query", k=5)
     """
 
+    __slots__ = ("_client", "_model_id", "_collection_name", "_owns_client")
+
     def __init__(
         self,
         host: str = "localhost",
         port: int = 50051,
         model_id: Optional[str] = None,
         collection_name: Optional[str] = None,
+        client: Optional[ChitinClient] = None,
     ) -> None:
         """Initialize the ChitinVectorStore.
 
@@ -42,9 +86,15 @@ class ChitinVectorStore:
             port: gRPC port of the chitin-daemon.
             model_id: Embedding model to use (None = daemon default).
             collection_name: Optional Reef Zone name to scope searches.
+            client: Existing connected client to reuse. The caller keeps
+                ownership: it is not connected or closed by the store,
+                and host/port are ignored.
         """
-        self._client = ChitinClient(host=host, port=port)
-        self._client.connect()
+        self._owns_client = client is None
+        if client is None:
+            client = ChitinClient(host=host, port=port)
+            client.connect()
+        self._client = client
         self._model_id = model_id
         self._collection_name = collection_name
 
@@ -56,6 +106,8 @@ class ChitinVectorStore:
     ) -> list[str]:
         """Add texts to the Reef as Polyps.
 
+        Texts are submitted in batches of up to 256 per round-trip.
+
         Args:
             texts: Iterable of text strings to add.
             metadatas: Optional list of metadata dicts (one per text).
@@ -64,16 +116,48 @@ class ChitinVectorStore:
         Returns:
             List of Polyp UUIDs for the added texts.
         """
-        ids = []
-        for i, text in enumerate(texts):
-            polyp_id = self._client.submit_polyp(
-                text=text,
-                content_type="text/plain",
-                model_id=self._model_id,
+        texts = list(texts)
+        ids: list[str] = []
+        for start in range(0, len(texts), _SUBMIT_BATCH_SIZE):
+            batch = texts[start:start + _SUBMIT_BATCH_SIZE]
+            ids.extend(
+                self._client.submit_polyps_batch(
+                    (text, "text/plain", self._model_id) for text in batch
+                )
             )
-            ids.append(polyp_id)
         return ids
 
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[list[dict[str, Any]]] = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Asynchronously add texts to the Reef as Polyps.
+
+        Submits each text as a concurrent unary call, with at most 64
+        in flight at once.
+
+        Args:
+            texts: Iterable of text strings to add.
+            metadatas: Optional list of metadata dicts (one per text).
+            **kwargs: Additional keyword arguments.
+
+        Returns:
+            List of Polyp UUIDs for the added texts, in input order.
+        """
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SUBMITS)
+
+        async def submit(text: str) -> str:
+            async with semaphore:
+                return await self._client.submit_polyp_async(
+                    text=text,
+                    content_type="text/plain",
+                    model_id=self._model_id,
+                )
+
+        return list(await asyncio.gather(*(submit(text) for text in texts)))
+
     def similarity_search(
         self,
         query: str,
@@ -95,23 +179,46 @@ class ChitinVectorStore:
             query=query,
             top_k=k,
             model_id=self._model_id,
+            collection=self._collection_name,
         )
         return [
             {
                 "page_content": r.payload.content,
-                "metadata": {
-                    "polyp_id": r.polyp_id,
-                    "cid": r.cid,
-                    "similarity": r.similarity,
-                    "trust_score": r.trust_score,
-                    "creator_did": r.creator_did,
-                    "state": r.state,
-                    "hardened_epoch": r.hardened_epoch,
-                },
+                "metadata": dict(zip(_METADATA_KEYS, _METADATA_GET(r))),
             }
             for r in results
         ]
 
+    def similarity_search_iter(
+        self,
+        query: str,
+        k: int = 4,
+        **kwargs: Any,
+    ) -> Iterator[dict[str, Any]]:
+        """Search the Reef, yielding documents as they arrive.
+
+        Same documents as similarity_search(), streamed so prompt
+        assembly can begin before all k results have arrived.
+
+        Args:
+            query: Natural language query string.
+            k: Number of results to return.
+            **kwargs: Additional keyword arguments.
+
+        Yields:
+            Document-like dictionaries with page_content and metadata.
+        """
+        for r in self._client.search_iter(
+            query=query,
+            top_k=k,
+            model_id=self._model_id,
+            collection=self._collection_name,
+        ):
+            yield {
+                "page_content": r.payload.content,
+                "metadata": dict(zip(_METADATA_KEYS, _METADATA_GET(r))),
+            }
+
     def similarity_search_with_score(
         self,
         query: str,
@@ -132,19 +239,13 @@ class ChitinVectorStore:
             query=query,
             top_k=k,
             model_id=self._model_id,
+            collection=self._collection_name,
         )
         return [
             (
                 {
                     "page_content": r.payload.content,
-                    "metadata": {
-                        "polyp_id": r.polyp_id,
-                        "cid": r.cid,
-                        "trust_score": r.trust_score,
-                        "creator_did": r.creator_did,
-                        "state": r.state,
-                        "hardened_epoch": r.hardened_epoch,
-                    },
+                    "metadata": dict(zip(_SCORED_METADATA_KEYS, _SCORED_METADATA_GET(r))),
                 },
                 r.similarity,
             )
@@ -152,5 +253,6 @@ class ChitinVectorStore:
         ]
 
     def close(self) -> None:
-        """Close the underlying client connection."""
-        self._client.close()
+        """Close the underlying client connection, unless it was injected."""
+        if self._owns_client:
+            self._client.close()
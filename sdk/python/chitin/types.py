@@ -1,16 +1,20 @@
 """Python dataclasses mirroring Rust types from chitin-core.
 
-All types use pydantic BaseModel for validation, serialization,
-and compatibility with modern Python tooling.
+All types are msgspec Structs: slotted, C-implemented classes with
+fast typed JSON (de)serialization. Field constraints are enforced
+when decoding daemon responses; PolypScores also checks its bounds on
+direct construction.
 """
 
 from __future__ import annotations
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Annotated, Any, ClassVar, Optional
 
-from pydantic import BaseModel, Field
+import msgspec
+import numpy as np
+from msgspec import Meta, field
 
 
 class PolypState(str, Enum):
@@ -24,127 +28,343 @@ class PolypState(str, Enum):
     MOLTED = "Molted"
 
 
-class EmbeddingModelId(BaseModel):
-    """Identifies a specific embedding model version."""
-    provider: str = Field(description="Model family (e.g., 'openai', 'bge', 'nomic')")
-    name: str = Field(description="Model name (e.g., 'text-embedding-3-small')")
-    weights_hash: str = Field(description="SHA-256 hash of model weights (hex)")
-    dimensions: int = Field(description="Output dimensionality")
-
+# Score dimensions are constrained to the unit interval.
+UnitFloat = Annotated[float, Meta(ge=0.0, le=1.0)]
 
-class VectorEmbedding(BaseModel):
-    """A vector embedding with full model provenance."""
-    values: list[float] = Field(description="The raw float vector")
-    model_id: EmbeddingModelId = Field(description="Which model produced this vector")
-    quantization: str = Field(default="float32", description="Quantization applied")
-    normalization: str = Field(default="l2", description="Normalization applied")
+# Default PolypScores dimension weights, in field order.
+_SCORE_WEIGHTS = np.array([0.30, 0.25, 0.15, 0.15, 0.15], dtype=np.float64)
 
 
-class Payload(BaseModel):
+class EmbeddingModelId(msgspec.Struct, kw_only=True, frozen=True, gc=False):
+    """Identifies a specific embedding model version."""
+    provider: Annotated[str, Meta(description="Model family (e.g., 'openai', 'bge', 'nomic')")]
+    name: Annotated[str, Meta(description="Model name (e.g., 'text-embedding-3-small')")]
+    weights_hash: Annotated[str, Meta(description="SHA-256 hash of model weights (hex)")]
+    dimensions: Annotated[int, Meta(description="Output dimensionality")]
+
+
+class VectorEmbedding(msgspec.Struct, kw_only=True, frozen=True, eq=False):
+    """A vector embedding with full model provenance.
+
+    ``values`` is always a contiguous float32 array; lists and other
+    array-likes are converted on construction, and float32 arrays
+    (including read-only views from vector_from_bytes) are kept as-is.
+    Instances compare equal when their vectors and metadata match.
+
+    When ``quantization`` is "int8" the vector travels as ``values_q8``
+    plus ``q8_scale`` and ``values`` may be empty; use ``values_f32`` to
+    read the vector regardless of encoding.
+    """
+    values: Annotated[np.ndarray, Meta(description="The raw float32 vector, shape (dim,)")]
+    model_id: Annotated[EmbeddingModelId, Meta(description="Which model produced this vector")]
+    quantization: Annotated[str, Meta(description="Quantization applied")] = "float32"
+    normalization: Annotated[str, Meta(description="Normalization applied")] = "l2"
+    values_q8: Annotated[Optional[bytes], Meta(description="int8-quantized vector (if quantization is 'int8')")] = None
+    q8_scale: Annotated[float, Meta(description="Scale factor for values_q8")] = 0.0
+
+    def __post_init__(self) -> None:
+        msgspec.structs.force_setattr(
+            self, "values", np.ascontiguousarray(self.values, dtype=np.float32)
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VectorEmbedding):
+            return NotImplemented
+        return (
+            self.model_id == other.model_id
+            and self.quantization == other.quantization
+            and self.normalization == other.normalization
+            and self.values_q8 == other.values_q8
+            and self.q8_scale == other.q8_scale
+            and np.array_equal(self.values, other.values)
+        )
+
+    @property
+    def values_f32(self) -> np.ndarray:
+        """The vector as float32, dequantizing int8 storage if needed."""
+        if self.quantization == "int8" and self.values_q8 is not None:
+            return dequantize_int8(self.values_q8, self.q8_scale)
+        return self.values
+
+    def quantize(self) -> VectorEmbedding:
+        """Return an int8-quantized copy of this embedding."""
+        if self.quantization == "int8":
+            return self
+        q8, scale = quantize_int8(self.values)
+        return msgspec.structs.replace(
+            self,
+            values=np.empty(0, dtype=np.float32),
+            quantization="int8",
+            values_q8=q8,
+            q8_scale=scale,
+        )
+
+
+def quantize_int8(values: Any) -> tuple[bytes, float]:
+    """Symmetrically quantize a float vector to int8.
+
+    Returns the packed int8 bytes and the scale such that
+    ``q * scale`` approximates the original values.
+
+    Raises:
+        ValueError: If the vector contains NaN or infinite values.
+    """
+    v = np.asarray(values, dtype=np.float32)
+    if not np.isfinite(v).all():
+        raise ValueError("cannot quantize a vector with NaN or infinite values")
+    max_abs = float(np.max(np.abs(v))) if v.size else 0.0
+    if max_abs == 0.0:
+        return np.zeros(v.size, dtype=np.int8).tobytes(), 0.0
+    scale = max_abs / 127.0
+    q = np.clip(np.round(v / scale), -127, 127).astype(np.int8)
+    return q.tobytes(), scale
+
+
+def dequantize_int8(buf: bytes, scale: float) -> np.ndarray:
+    """Expand int8 bytes produced by quantize_int8 back to float32."""
+    return np.frombuffer(buf, dtype=np.int8).astype(np.float32) * np.float32(scale)
+
+
+def vector_from_bytes(buf: bytes) -> np.ndarray:
+    """View a raw little-endian f32 vector blob as a float32 array.
+
+    No copy is made: the result is a read-only view that holds a
+    reference to ``buf``, so it stays valid after the protobuf message
+    the bytes came from is released.
+    """
+    return np.frombuffer(buf, dtype="<f4")
+
+
+def vector_to_bytes(values: Any) -> bytes:
+    """Pack a float vector as a raw little-endian f32 blob."""
+    return np.asarray(values, dtype="<f4").tobytes()
+
+
+class Payload(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """The human-readable knowledge content."""
-    content: str = Field(description="The raw text, code snippet, or structured data")
-    content_type: str = Field(default="text/plain", description="MIME type of the content")
-    language: Optional[str] = Field(default=None, description="Language code (e.g., 'en', 'es')")
+    content: Annotated[str, Meta(description="The raw text, code snippet, or structured data")]
+    content_type: Annotated[str, Meta(description="MIME type of the content")] = "text/plain"
+    language: Annotated[Optional[str], Meta(description="Language code (e.g., 'en', 'es')")] = None
 
 
-class ZkProof(BaseModel):
+class ZkProof(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """ZK proof attesting to correct embedding generation."""
-    proof_type: str = Field(description="Proof system identifier: 'SP1Groth16', 'Risc0Stark', etc.")
-    proof_value: str = Field(description="Hex-encoded proof bytes")
-    vk_hash: str = Field(description="The verification key hash (identifies the circuit)")
-    text_hash: str = Field(description="SHA-256 hash of the source text (hex)")
-    vector_hash: str = Field(description="SHA-256 hash of the resulting vector bytes (hex)")
-    model_id: str = Field(description="Embedding model identifier")
-    created_at: datetime = Field(description="Timestamp of proof generation")
+    proof_type: Annotated[str, Meta(description="Proof system identifier: 'SP1Groth16', 'Risc0Stark', etc.")]
+    proof_value: Annotated[str, Meta(description="Hex-encoded proof bytes")]
+    vk_hash: Annotated[str, Meta(description="The verification key hash (identifies the circuit)")]
+    text_hash: Annotated[str, Meta(description="SHA-256 hash of the source text (hex)")]
+    vector_hash: Annotated[str, Meta(description="SHA-256 hash of the resulting vector bytes (hex)")]
+    model_id: Annotated[str, Meta(description="Embedding model identifier")]
+    created_at: Annotated[datetime, Meta(description="Timestamp of proof generation")]
 
 
-class SourceAttribution(BaseModel):
+class SourceAttribution(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """Attribution to the original source."""
-    source_cid: Optional[str] = Field(default=None, description="IPFS CID of the original source document")
-    source_url: Optional[str] = Field(default=None, description="URL of the original source")
-    title: Optional[str] = Field(default=None, description="Human-readable title or description")
-    license: Optional[str] = Field(default=None, description="License under which the source is available")
-    accessed_at: datetime = Field(description="Timestamp when the source was accessed")
+    source_cid: Annotated[Optional[str], Meta(description="IPFS CID of the original source document")] = None
+    source_url: Annotated[Optional[str], Meta(description="URL of the original source")] = None
+    title: Annotated[Optional[str], Meta(description="Human-readable title or description")] = None
+    license: Annotated[Optional[str], Meta(description="License under which the source is available")] = None
+    accessed_at: Annotated[datetime, Meta(description="Timestamp when the source was accessed")]
 
 
-class PipelineStep(BaseModel):
+class PipelineStep(msgspec.Struct, kw_only=True, frozen=True):
     """A single step in the processing pipeline."""
     name: str
     version: str
-    params: dict[str, Any] = Field(default_factory=dict)
+    params: dict[str, Any] = field(default_factory=dict)
 
 
-class ProcessingPipeline(BaseModel):
+class ProcessingPipeline(msgspec.Struct, kw_only=True, frozen=True):
     """Describes the processing pipeline that produced the Polyp."""
-    steps: list[PipelineStep] = Field(default_factory=list)
-    duration_ms: int = Field(default=0, description="Total wall-clock time (milliseconds)")
+    steps: list[PipelineStep] = field(default_factory=list)
+    duration_ms: Annotated[int, Meta(description="Total wall-clock time (milliseconds)")] = 0
 
 
-class Provenance(BaseModel):
+class Provenance(msgspec.Struct, kw_only=True, frozen=True):
     """Full provenance chain for a Polyp."""
-    creator_hotkey: str = Field(description="Hex-encoded hotkey of the creator node")
-    creator_did: str = Field(description="DID of the creator node")
+    creator_hotkey: Annotated[str, Meta(description="Hex-encoded hotkey of the creator node")]
+    creator_did: Annotated[str, Meta(description="DID of the creator node")]
     source: SourceAttribution
     pipeline: ProcessingPipeline
 
 
-class NodeIdentity(BaseModel):
+class NodeIdentity(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """Identity of a node on the Chitin network."""
-    coldkey: str = Field(description="Coldkey public key (hex)")
-    hotkey: str = Field(description="Hotkey public key (hex)")
-    did: str = Field(description="DID derived from coldkey")
-    node_type: str = Field(description="'Coral', 'Tide', or 'Hybrid'")
+    coldkey: Annotated[str, Meta(description="Coldkey public key (hex)")]
+    hotkey: Annotated[str, Meta(description="Hotkey public key (hex)")]
+    did: Annotated[str, Meta(description="DID derived from coldkey")]
+    node_type: Annotated[str, Meta(description="'Coral', 'Tide', or 'Hybrid'")]
 
 
-class PolypScores(BaseModel):
+class PolypScores(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """Multi-dimensional quality scores for a Polyp. Each dimension is 0.0 to 1.0."""
-    zk_validity: float = Field(ge=0.0, le=1.0, description="Did the ZK proof verify? Binary: 0.0 or 1.0")
-    semantic_quality: float = Field(ge=0.0, le=1.0, description="Semantic quality: coherence, informativeness")
-    novelty: float = Field(ge=0.0, le=1.0, description="How much new information does this Polyp add?")
-    source_credibility: float = Field(ge=0.0, le=1.0, description="Reputation of creator + source quality")
-    embedding_quality: float = Field(ge=0.0, le=1.0, description="Cosine similarity vs reference embedding")
+    zk_validity: Annotated[UnitFloat, Meta(description="Did the ZK proof verify? Binary: 0.0 or 1.0")]
+    semantic_quality: Annotated[UnitFloat, Meta(description="Semantic quality: coherence, informativeness")]
+    novelty: Annotated[UnitFloat, Meta(description="How much new information does this Polyp add?")]
+    source_credibility: Annotated[UnitFloat, Meta(description="Reputation of creator + source quality")]
+    embedding_quality: Annotated[UnitFloat, Meta(description="Cosine similarity vs reference embedding")]
 
     # Default dimension weights for computing final score
-    DEFAULT_WEIGHTS: list[float] = [0.30, 0.25, 0.15, 0.15, 0.15]
+    DEFAULT_WEIGHTS: ClassVar[list[float]] = _SCORE_WEIGHTS.tolist()
+
+    def __post_init__(self) -> None:
+        for name in self.__struct_fields__:
+            value = getattr(self, name)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0.0 and 1.0, got {value!r}")
+
+    def as_array(self) -> np.ndarray:
+        """Return the five score dimensions as a float64 vector."""
+        return np.array(
+            (
+                self.zk_validity,
+                self.semantic_quality,
+                self.novelty,
+                self.source_credibility,
+                self.embedding_quality,
+            ),
+            dtype=np.float64,
+        )
 
     def weighted_score(self) -> float:
-        """Compute weighted final score."""
-        vals = [
+        """Compute weighted final score.
+
+        Plain Python beats NumPy for a single 5-element dot product;
+        use weighted_scores_batch to score many at once.
+        """
+        vals = (
             self.zk_validity,
             self.semantic_quality,
             self.novelty,
             self.source_credibility,
             self.embedding_quality,
-        ]
+        )
         return sum(v * w for v, w in zip(vals, self.DEFAULT_WEIGHTS))
 
 
-class PolypSubject(BaseModel):
+def weighted_scores_batch(scores: list[PolypScores]) -> np.ndarray:
+    """Compute weighted final scores for many PolypScores at once.
+
+    Stacks the scores into an (N, 5) matrix and applies the default
+    weights with a single matrix-vector product.
+    """
+    matrix = np.array(
+        [
+            (
+                s.zk_validity,
+                s.semantic_quality,
+                s.novelty,
+                s.source_credibility,
+                s.embedding_quality,
+            )
+            for s in scores
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    return matrix @ _SCORE_WEIGHTS
+
+
+class PolypSubject(msgspec.Struct, kw_only=True, frozen=True):
     """The subject of a Polyp: payload (human-readable) + vector (machine-readable)."""
     payload: Payload
     vector: VectorEmbedding
     provenance: Provenance
 
 
-class Polyp(BaseModel):
+class Polyp(msgspec.Struct, kw_only=True, frozen=True):
     """The atomic unit of knowledge in Reefipedia."""
-    id: str = Field(description="Unique identifier (UUID v7)")
-    state: PolypState = Field(description="Current lifecycle state")
-    subject: PolypSubject = Field(description="The knowledge content: text + embedding + provenance")
-    proof: ZkProof = Field(description="ZK proof attesting Vector = Model(Text)")
-    consensus: Optional[dict[str, Any]] = Field(default=None, description="Consensus metadata (populated after validation)")
-    hardening: Optional[dict[str, Any]] = Field(default=None, description="Hardening lineage (populated after hardening)")
-    created_at: datetime = Field(description="Creation timestamp")
-    updated_at: datetime = Field(description="Last state transition timestamp")
+    id: Annotated[str, Meta(description="Unique identifier (UUID v7)")]
+    state: Annotated[PolypState, Meta(description="Current lifecycle state")]
+    subject: Annotated[PolypSubject, Meta(description="The knowledge content: text + embedding + provenance")]
+    proof: Annotated[ZkProof, Meta(description="ZK proof attesting Vector = Model(Text)")]
+    consensus: Annotated[Optional[dict[str, Any]], Meta(description="Consensus metadata (populated after validation)")] = None
+    hardening: Annotated[Optional[dict[str, Any]], Meta(description="Hardening lineage (populated after hardening)")] = None
+    created_at: Annotated[datetime, Meta(description="Creation timestamp")]
+    updated_at: Annotated[datetime, Meta(description="Last state transition timestamp")]
 
 
-class SearchResult(BaseModel):
+class SearchResult(msgspec.Struct, kw_only=True, frozen=True, gc=False):
     """A single result from a semantic search query."""
-    polyp_id: str = Field(description="Polyp UUID")
-    cid: Optional[str] = Field(default=None, description="IPFS CID (if hardened)")
-    payload: Payload = Field(description="The text content")
-    similarity: float = Field(description="Cosine similarity to query")
-    trust_score: float = Field(default=0.0, description="Composite trust score")
-    creator_did: str = Field(default="", description="DID of the creator node")
-    state: str = Field(default="Hardened", description="Polyp lifecycle state")
-    hardened_epoch: Optional[int] = Field(default=None, description="Epoch when hardened")
+    polyp_id: Annotated[str, Meta(description="Polyp UUID")]
+    cid: Annotated[Optional[str], Meta(description="IPFS CID (if hardened)")] = None
+    payload: Annotated[Payload, Meta(description="The text content")]
+    similarity: Annotated[float, Meta(description="Cosine similarity to query")]
+    trust_score: Annotated[float, Meta(description="Composite trust score")] = 0.0
+    creator_did: Annotated[str, Meta(description="DID of the creator node")] = ""
+    state: Annotated[str, Meta(description="Polyp lifecycle state")] = "Hardened"
+    hardened_epoch: Annotated[Optional[int], Meta(description="Epoch when hardened")] = None
+
+
+class _SearchHit(msgspec.Struct, frozen=True, gc=False):
+    """One hit as serialized by the daemon's query/search handler."""
+    polyp_id: str
+    similarity: float
+    content: Optional[str] = None
+    state: str = "Hardened"
+    cid: Optional[str] = None
+
+
+class _SemanticSearchResponse(msgspec.Struct, frozen=True, gc=False):
+    """Result body of the daemon's query/search method."""
+    results: list[_SearchHit]
+    search_time_ms: int = 0
+    total_found: int = 0
+
+
+class _SearchRpcResponse(msgspec.Struct, frozen=True, gc=False):
+    """Daemon JSON-RPC response envelope carrying a search result."""
+    success: bool
+    result: Optional[_SemanticSearchResponse] = None
+    error: Optional[str] = None
+
+
+def _dec_hook(type_: type, obj: Any) -> Any:
+    """Decode types msgspec has no native support for."""
+    if type_ is np.ndarray:
+        return np.asarray(obj, dtype=np.float32)
+    raise NotImplementedError(f"Unsupported type: {type_!r}")
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode types msgspec has no native support for."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise NotImplementedError(f"Unsupported type: {type(obj)!r}")
+
+
+# Typed decoders are built once and reused: constructing a Decoder
+# inspects the target type, decoding with it does not.
+_POLYP_DECODER = msgspec.json.Decoder(Polyp, dec_hook=_dec_hook)
+_POLYP_ENCODER = msgspec.json.Encoder(enc_hook=_enc_hook)
+_SEARCH_RESPONSE_DECODER = msgspec.json.Decoder(_SearchRpcResponse)
+
+
+def decode_polyp(data: bytes) -> Polyp:
+    """Decode a JSON-encoded Polyp from the daemon."""
+    return _POLYP_DECODER.decode(data)
+
+
+def encode_polyp(polyp: Polyp) -> bytes:
+    """Encode a Polyp (or any type containing vectors) as JSON."""
+    return _POLYP_ENCODER.encode(polyp)
+
+
+def decode_search_results(data: bytes) -> list[SearchResult]:
+    """Decode the daemon's query/search response into SearchResults.
+
+    Raises:
+        RuntimeError: If the daemon reported a failed request.
+    """
+    response = _SEARCH_RESPONSE_DECODER.decode(data)
+    if not response.success or response.result is None:
+        raise RuntimeError(response.error or "search failed")
+    return [
+        SearchResult(
+            polyp_id=hit.polyp_id,
+            cid=hit.cid,
+            payload=Payload(content=hit.content or ""),
+            similarity=hit.similarity,
+            state=hit.state,
+        )
+        for hit in response.result.results
+    ]
@@ -0,0 +1,24 @@
+"""Build script for chitin-py.
+
+Set CHITIN_USE_MYPYC=1 to compile the agent and LangChain adapters with
+mypyc (requires mypy in the build environment, e.g.
+``pip install mypy wheel && CHITIN_USE_MYPYC=1 pip install --no-build-isolation .``).
+Without it the package installs as pure Python.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("CHITIN_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # types.py is already backed by msgspec's C Structs; only the
+    # pure-Python adapter glue benefits from compilation.
+    ext_modules = mypycify(
+        ["chitin/agent.py", "chitin/langchain.py"],
+        opt_level="3",
+    )
+
+setup(ext_modules=ext_modules)
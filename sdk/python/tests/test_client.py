@@ -4,7 +4,9 @@ Tests client instantiation, type creation, and ChitinMemory interface.
 Phase 1: Tests run without a live daemon connection.
 """
 
+import numpy as np
 import pytest
+import uuid
 from datetime import datetime, timezone
 
 
@@ -36,6 +38,72 @@ class TestChitinClient:
             assert client._connected is True
         assert client._connected is False
 
+    def test_clients_share_channel(self):
+        """Clients for the same daemon should share one refcounted channel."""
+        from chitin import client as client_mod
+        from chitin.client import ChitinClient
+
+        a = ChitinClient(port=50999)
+        b = ChitinClient(port=50999)
+        a.connect()
+        b.connect()
+        assert a._channel is b._channel
+        a.close()
+        assert ("localhost", 50999) in client_mod._CHANNEL_CACHE
+        b.close()
+        assert ("localhost", 50999) not in client_mod._CHANNEL_CACHE
+
+    def test_client_finalizer_during_acquire_does_not_deadlock(self):
+        """A GC-run finalizer inside _acquire_channel should not deadlock.
+
+        Runs in a subprocess so a regression fails on timeout instead of
+        hanging the test session.
+        """
+        import os
+        import subprocess
+        import sys
+        import textwrap
+
+        script = textwrap.dedent(
+            """
+            import gc
+            from chitin import client as client_mod
+
+            real_channel = client_mod.grpc.insecure_channel
+
+            def collecting_channel(*args, **kwargs):
+                gc.collect()
+                return real_channel(*args, **kwargs)
+
+            gc.disable()
+            leaked = client_mod.ChitinClient(port=1)
+            leaked.connect()
+            cycle = [leaked]
+            cycle.append(cycle)
+            del leaked, cycle
+            client_mod.grpc.insecure_channel = collecting_channel
+            client = client_mod.ChitinClient(port=2)
+            client.connect()
+            assert list(client_mod._CHANNEL_CACHE) == [("localhost", 2)]
+            """
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run(
+            [sys.executable, "-c", script], cwd=root, timeout=30, capture_output=True
+        )
+        assert proc.returncode == 0, proc.stderr.decode()
+
+    def test_client_from_env_is_shared(self, monkeypatch):
+        """from_env should return one connected client per host/port."""
+        from chitin.client import ChitinClient
+
+        monkeypatch.setenv("CHITIN_HOST", "10.0.0.7")
+        monkeypatch.setenv("CHITIN_PORT", "7000")
+        client = ChitinClient.from_env()
+        assert client is ChitinClient.from_env()
+        assert (client.host, client.port) == ("10.0.0.7", 7000)
+        assert client._connected is True
+
     def test_client_submit_polyp_placeholder(self):
         """submit_polyp should return a placeholder UUID in Phase 1."""
         from chitin.client import ChitinClient
@@ -45,6 +113,16 @@ class TestChitinClient:
             assert isinstance(polyp_id, str)
             assert len(polyp_id) > 0
 
+    def test_client_submit_polyps_batch_placeholder(self):
+        """submit_polyps_batch should return one ID per submitted item."""
+        from chitin.client import ChitinClient
+
+        with ChitinClient() as client:
+            ids = client.submit_polyps_batch(
+                [("fact one", "text/plain", None), ("fact two", "text/plain", None)]
+            )
+            assert len(ids) == 2
+
     def test_client_search_placeholder(self):
         """search should return an empty list in Phase 1."""
         from chitin.client import ChitinClient
@@ -54,6 +132,58 @@ class TestChitinClient:
             assert isinstance(results, list)
             assert len(results) == 0
 
+    def test_client_search_iter_uses_cache(self):
+        """A fully consumed search_iter should populate the cache."""
+        from chitin.client import ChitinClient
+
+        with ChitinClient() as client:
+            assert list(client.search_iter("test query", top_k=3)) == []
+            assert client._cache.get("test query", 3, (None, None, None, None)) == []
+
+    def test_client_encode_request(self):
+        """_encode_request should emit the daemon's {method, params} envelope."""
+        import json
+        from chitin.client import ChitinClient, _SearchParams
+
+        client = ChitinClient()
+        req = client._encode_request("query/search", _SearchParams(query_text="q"))
+        assert json.loads(req) == {
+            "method": "query/search",
+            "params": {"query_text": "q"},
+        }
+
+    def test_client_encode_submit_request(self):
+        """polyp/submit requests should always carry content_type."""
+        import json
+        from chitin.client import ChitinClient, _SubmitPolypParams
+
+        client = ChitinClient()
+        req = client._encode_request("polyp/submit", _SubmitPolypParams(content="fact"))
+        assert json.loads(req) == {
+            "method": "polyp/submit",
+            "params": {"content": "fact", "content_type": "text/plain"},
+        }
+
+    def test_client_search_scope_partitions_cache(self):
+        """Searches with different collections should not share cache entries."""
+        from chitin.client import ChitinClient
+
+        with ChitinClient(port=50998) as client:
+            client.search("test query", top_k=3, collection="science")
+            assert client._cache.get("test query", 3, (None, "science", None, None)) == []
+            assert client._cache.get("test query", 3, (None, None, None, None)) is None
+
+    def test_clients_share_search_cache(self):
+        """A write through one client should invalidate its peers' cache."""
+        from chitin.client import ChitinClient
+
+        with ChitinClient(port=50997) as reader, ChitinClient(port=50997) as writer:
+            assert reader._cache is writer._cache
+            reader.search("test query", top_k=3)
+            assert writer._cache.get("test query", 3, (None, None, None, None)) == []
+            writer.submit_polyp("new fact")
+            assert reader._cache.get("test query", 3, (None, None, None, None)) is None
+
     def test_client_get_node_info(self):
         """get_node_info should return a dict with expected keys."""
         from chitin.client import ChitinClient
@@ -65,6 +195,73 @@ class TestChitinClient:
             assert "version" in info
             assert info["connected"] is True
 
+    def test_client_get_node_info_cached(self):
+        """get_node_info should reuse the daemon response within the TTL."""
+        from chitin.client import ChitinClient
+
+        with ChitinClient() as client:
+            client.get_node_info()
+            fetched = client._node_info
+            info = client.get_node_info()
+            assert client._node_info is fetched
+            info["version"] = "mutated"
+            assert client.get_node_info()["version"] == "0.1.0"
+            client.get_node_info(ttl=0.0)
+            assert client._node_info is not fetched
+        assert client._node_info is None
+
+
+class TestSemanticSearchCache:
+    """Tests for the client-side search result cache."""
+
+    @staticmethod
+    def _result(polyp_id):
+        from chitin.types import Payload, SearchResult
+
+        return SearchResult(polyp_id=polyp_id, payload=Payload(content="x"), similarity=1.0)
+
+    def test_exact_hit_truncates_to_top_k(self):
+        """An exact hit should serve any request up to the cached top_k."""
+        from chitin.cache import SemanticSearchCache
+
+        cache = SemanticSearchCache()
+        results = [self._result("a"), self._result("b")]
+        cache.put("q", 2, None, results)
+        assert cache.get("q", 1) == results[:1]
+        assert cache.get("q", 5) is None
+        assert cache.get("q", 1, scope="other") is None
+
+    def test_semantic_hit(self):
+        """A paraphrase with a near-identical embedding should hit."""
+        from chitin.cache import SemanticSearchCache
+
+        vectors = {"fast light": [1.0, 0.0], "light speed": [0.99, 0.05], "pizza": [0.0, 1.0]}
+        cache = SemanticSearchCache(embedder=vectors.__getitem__)
+        results = [self._result("a")]
+        cache.put("fast light", 1, None, results)
+        assert cache.get("light speed", 1) == results
+        assert cache.get("pizza", 1) is None
+
+    def test_embedder_runs_outside_lock(self):
+        """The embedder should not be called while the cache lock is held."""
+        from chitin.cache import SemanticSearchCache
+
+        def embed(query):
+            assert not cache._lock.locked()
+            return [1.0, 0.0]
+
+        cache = SemanticSearchCache(embedder=embed)
+        cache.put("q", 1, None, [self._result("a")])
+        assert cache.get("paraphrase", 1) is not None
+
+    def test_entries_expire(self):
+        """Entries older than ttl should miss."""
+        from chitin.cache import SemanticSearchCache
+
+        cache = SemanticSearchCache(ttl=-1.0)
+        cache.put("q", 1, None, [self._result("a")])
+        assert cache.get("q", 1) is None
+
 
 class TestTypes:
     """Tests for Chitin SDK type creation and validation."""
@@ -118,8 +315,136 @@ class TestTypes:
             model_id=model,
         )
         assert len(vec.values) == 3
+        assert vec.values.dtype == np.float32
         assert vec.quantization == "float32"
 
+    def test_vector_embedding_keeps_float32_view(self):
+        """A float32 array from the wire should be stored without copying."""
+        from chitin.types import (
+            VectorEmbedding,
+            EmbeddingModelId,
+            vector_from_bytes,
+            vector_to_bytes,
+        )
+
+        model = EmbeddingModelId(
+            provider="bge",
+            name="bge-small-en-v1.5",
+            weights_hash="abc123",
+            dimensions=2,
+        )
+        view = vector_from_bytes(vector_to_bytes([0.25, 0.75]))
+        vec = VectorEmbedding(values=view, model_id=model)
+        assert vec.values is view
+
+    def test_vector_embedding_int8_quantization(self):
+        """quantize should shrink storage and dequantize within one step."""
+        from chitin.types import VectorEmbedding, EmbeddingModelId
+
+        model = EmbeddingModelId(
+            provider="bge",
+            name="bge-small-en-v1.5",
+            weights_hash="abc123",
+            dimensions=4,
+        )
+        vec = VectorEmbedding(values=[0.5, -0.25, 0.125, 0.0], model_id=model)
+        q = vec.quantize()
+        assert q.quantization == "int8"
+        assert len(q.values_q8) == 4
+        step = q.q8_scale
+        for got, want in zip(q.values_f32.tolist(), vec.values):
+            assert abs(got - want) <= step
+
+    def test_quantize_int8_rejects_non_finite(self):
+        """quantize_int8 should refuse NaN and infinite components."""
+        from chitin.types import quantize_int8
+
+        with pytest.raises(ValueError):
+            quantize_int8([float("nan"), 1.0])
+        with pytest.raises(ValueError):
+            quantize_int8([float("inf"), 1.0])
+
+    def test_vector_embedding_equality(self):
+        """VectorEmbeddings with equal vectors and metadata should compare equal."""
+        from chitin.types import VectorEmbedding, EmbeddingModelId
+
+        model = EmbeddingModelId(
+            provider="bge",
+            name="bge-small-en-v1.5",
+            weights_hash="abc123",
+            dimensions=2,
+        )
+        vec = VectorEmbedding(values=[0.25, 0.75], model_id=model)
+        assert vec == VectorEmbedding(values=np.array([0.25, 0.75]), model_id=model)
+        assert vec != VectorEmbedding(values=[0.25, 0.5], model_id=model)
+        assert vec != VectorEmbedding(values=[0.25, 0.75], model_id=model, normalization="none")
+
+    def test_polyp_json_roundtrip(self):
+        """encode_polyp output should decode back to an equal Polyp."""
+        from chitin.types import (
+            EmbeddingModelId,
+            Payload,
+            PipelineStep,
+            Polyp,
+            PolypState,
+            PolypSubject,
+            ProcessingPipeline,
+            Provenance,
+            SourceAttribution,
+            VectorEmbedding,
+            ZkProof,
+            decode_polyp,
+            encode_polyp,
+        )
+
+        now = datetime.now(timezone.utc)
+        model = EmbeddingModelId(
+            provider="bge",
+            name="bge-small-en-v1.5",
+            weights_hash="abc123",
+            dimensions=2,
+        )
+        polyp = Polyp(
+            id=str(uuid.uuid4()),
+            state=PolypState.DRAFT,
+            subject=PolypSubject(
+                payload=Payload(content="Water boils at 100C"),
+                vector=VectorEmbedding(values=[0.25, 0.75], model_id=model),
+                provenance=Provenance(
+                    creator_hotkey="aabbccdd",
+                    creator_did="did:chitin:0xaabbccdd",
+                    source=SourceAttribution(accessed_at=now),
+                    pipeline=ProcessingPipeline(
+                        steps=[PipelineStep(name="chunk", version="1.0")]
+                    ),
+                ),
+            ),
+            proof=ZkProof(
+                proof_type="SP1Groth16",
+                proof_value="00",
+                vk_hash="00",
+                text_hash="00",
+                vector_hash="00",
+                model_id="bge-small-en-v1.5",
+                created_at=now,
+            ),
+            created_at=now,
+            updated_at=now,
+        )
+        decoded = decode_polyp(encode_polyp(polyp))
+        assert decoded.subject.vector.values.dtype == np.float32
+        assert decoded == polyp
+
+    def test_vector_bytes_roundtrip(self):
+        """vector_from_bytes should view packed f32 bytes without copying."""
+        from chitin.types import vector_from_bytes, vector_to_bytes
+
+        buf = vector_to_bytes([0.5, -1.0, 2.0])
+        assert len(buf) == 12
+        arr = vector_from_bytes(buf)
+        assert arr.tolist() == [0.5, -1.0, 2.0]
+        assert arr.flags.writeable is False
+
     def test_polyp_scores_weighted(self):
         """PolypScores.weighted_score should compute correctly."""
         from chitin.types import PolypScores
@@ -140,6 +465,57 @@ class TestTypes:
         )
         assert abs(scores.weighted_score() - expected) < 1e-10
 
+    def test_polyp_scores_batch(self):
+        """weighted_scores_batch should match per-instance weighted_score."""
+        from chitin.types import PolypScores, weighted_scores_batch
+
+        scores = [
+            PolypScores(
+                zk_validity=1.0,
+                semantic_quality=0.8,
+                novelty=0.6,
+                source_credibility=0.7,
+                embedding_quality=0.9,
+            ),
+            PolypScores(
+                zk_validity=0.0,
+                semantic_quality=0.5,
+                novelty=0.5,
+                source_credibility=0.5,
+                embedding_quality=0.5,
+            ),
+        ]
+        batch = weighted_scores_batch(scores)
+        assert batch.shape == (2,)
+        for got, s in zip(batch, scores):
+            assert abs(got - s.weighted_score()) < 1e-10
+        assert weighted_scores_batch([]).shape == (0,)
+
+    def test_polyp_scores_rejects_out_of_range(self):
+        """Constructing PolypScores should enforce the 0.0-1.0 constraint."""
+        from chitin.types import PolypScores
+
+        with pytest.raises(ValueError):
+            PolypScores(
+                zk_validity=5.0,
+                semantic_quality=0.8,
+                novelty=0.6,
+                source_credibility=0.7,
+                embedding_quality=0.9,
+            )
+
+    def test_polyp_scores_decode_rejects_out_of_range(self):
+        """Decoding PolypScores should enforce the 0.0-1.0 constraint."""
+        import msgspec
+        from chitin.types import PolypScores
+
+        raw = (
+            b'{"zk_validity": 1.5, "semantic_quality": 0.8, "novelty": 0.6,'
+            b' "source_credibility": 0.7, "embedding_quality": 0.9}'
+        )
+        with pytest.raises(msgspec.ValidationError):
+            msgspec.json.decode(raw, type=PolypScores)
+
     def test_search_result_creation(self):
         """SearchResult should be creatable with required fields."""
         from chitin.types import SearchResult, Payload
@@ -153,6 +529,31 @@ class TestTypes:
         assert result.similarity == 0.95
         assert result.state == "Hardened"
 
+    def test_decode_search_results(self):
+        """decode_search_results should map the daemon's search response."""
+        from chitin.types import decode_search_results
+
+        raw = (
+            b'{"success": true, "result": {"results": [{"polyp_id":'
+            b' "00010203-0405-0607-0809-0a0b0c0d0e0f", "similarity": 0.5,'
+            b' "content": "Some text", "state": "Approved", "cid": null}],'
+            b' "search_time_ms": 3, "total_found": 1}, "error": null}'
+        )
+        [result] = decode_search_results(raw)
+        assert result.polyp_id == "00010203-0405-0607-0809-0a0b0c0d0e0f"
+        assert result.payload.content == "Some text"
+        assert result.state == "Approved"
+        assert result.cid is None
+        assert result.trust_score == 0.0
+
+    def test_decode_search_results_error(self):
+        """A failed daemon response should raise with the daemon's message."""
+        from chitin.types import decode_search_results
+
+        raw = b'{"success": false, "result": null, "error": "index unavailable"}'
+        with pytest.raises(RuntimeError, match="index unavailable"):
+            decode_search_results(raw)
+
     def test_provenance_creation(self):
         """Provenance should hold creator and source information."""
         from chitin.types import (
@@ -193,6 +594,29 @@ class TestChitinMemory:
         assert memory._client._connected is True
         memory.close()
 
+    def test_memory_injected_client(self):
+        """An injected client should be reused and left open on close."""
+        from chitin.agent import ChitinMemory
+        from chitin.client import ChitinClient
+
+        with ChitinClient() as client:
+            memory = ChitinMemory(client=client)
+            assert memory._client is client
+            memory.close()
+            assert client._connected is True
+
+    def test_memory_releases_channel_when_collected(self):
+        """An unclosed ChitinMemory should release its channel on collection."""
+        import gc
+        from chitin import client as client_mod
+        from chitin.agent import ChitinMemory
+
+        memory = ChitinMemory(port=50998)
+        assert ("localhost", 50998) in client_mod._CHANNEL_CACHE
+        del memory
+        gc.collect()
+        assert ("localhost", 50998) not in client_mod._CHANNEL_CACHE
+
     def test_memory_remember(self):
         """remember should return a polyp ID string."""
         from chitin.agent import ChitinMemory
@@ -212,6 +636,48 @@ class TestChitinMemory:
         assert isinstance(results, list)
         memory.close()
 
+    def test_memory_recall_projection(self, monkeypatch):
+        """recall should project SearchResults into flat dicts."""
+        from chitin.agent import ChitinMemory
+        from chitin.client import ChitinClient
+        from chitin.types import Payload, SearchResult
+
+        memory = ChitinMemory()
+        hit = SearchResult(
+            polyp_id="00000000-0000-0000-0000-000000000000",
+            payload=Payload(content="Mars is red"),
+            similarity=0.9,
+        )
+        monkeypatch.setattr(ChitinClient, "search", lambda self, **kw: [hit])
+        assert memory.recall("red planet") == [
+            {
+                "polyp_id": "00000000-0000-0000-0000-000000000000",
+                "text": "Mars is red",
+                "similarity": 0.9,
+                "trust_score": 0.0,
+                "state": "Hardened",
+            }
+        ]
+        memory.close()
+
+    def test_memory_recall_iter(self, monkeypatch):
+        """recall_iter should lazily yield the same dicts as recall."""
+        from chitin.agent import ChitinMemory
+        from chitin.client import ChitinClient
+        from chitin.types import Payload, SearchResult
+
+        memory = ChitinMemory()
+        hit = SearchResult(
+            polyp_id="00000000-0000-0000-0000-000000000000",
+            payload=Payload(content="Mars is red"),
+            similarity=0.9,
+        )
+        monkeypatch.setattr(ChitinClient, "search_iter", lambda self, **kw: iter([hit]))
+        stream = memory.recall_iter("red planet")
+        assert next(stream)["text"] == "Mars is red"
+        assert next(stream, None) is None
+        memory.close()
+
     def test_memory_forget(self):
         """forget should return False in Phase 1 (not implemented)."""
         from chitin.agent import ChitinMemory
@@ -220,3 +686,77 @@ class TestChitinMemory:
         result = memory.forget("some-uuid")
         assert result is False
         memory.close()
+
+
+class TestChitinVectorStore:
+    """Tests for the LangChain ChitinVectorStore adapter."""
+
+    def test_add_texts_spans_batches(self):
+        """add_texts should return one ID per text across batch boundaries."""
+        from chitin.langchain import ChitinVectorStore, _SUBMIT_BATCH_SIZE
+
+        store = ChitinVectorStore()
+        texts = (f"fact {i}" for i in range(_SUBMIT_BATCH_SIZE + 3))
+        ids = store.add_texts(texts)
+        assert len(ids) == _SUBMIT_BATCH_SIZE + 3
+        store.close()
+
+    def test_similarity_search_metadata(self, monkeypatch):
+        """similarity_search* should expose SearchResult fields as metadata."""
+        from chitin.client import ChitinClient
+        from chitin.langchain import ChitinVectorStore
+        from chitin.types import Payload, SearchResult
+
+        store = ChitinVectorStore(collection_name="astronomy")
+        hit = SearchResult(
+            polyp_id="00000000-0000-0000-0000-000000000000",
+            payload=Payload(content="Mars is red"),
+            similarity=0.9,
+        )
+        calls = []
+
+        def fake_search(self, **kw):
+            calls.append(kw)
+            return [hit]
+
+        monkeypatch.setattr(ChitinClient, "search", fake_search)
+
+        [doc] = store.similarity_search("red planet")
+        assert calls[-1]["collection"] == "astronomy"
+        assert doc["page_content"] == "Mars is red"
+        assert doc["metadata"]["polyp_id"] == "00000000-0000-0000-0000-000000000000"
+        assert doc["metadata"]["similarity"] == 0.9
+
+        [(doc, score)] = store.similarity_search_with_score("red planet")
+        assert score == 0.9
+        assert "similarity" not in doc["metadata"]
+        assert doc["metadata"]["state"] == "Hardened"
+        store.close()
+
+    def test_aadd_texts(self):
+        """aadd_texts should return one ID per text."""
+        import asyncio
+        from chitin.langchain import ChitinVectorStore
+
+        store = ChitinVectorStore()
+        ids = asyncio.run(store.aadd_texts(["fact one", "fact two", "fact three"]))
+        assert len(ids) == 3
+        store.close()
+
+    def test_encode_results(self, monkeypatch):
+        """encode_results should produce JSON equivalent to json.dumps."""
+        import json
+        from chitin.client import ChitinClient
+        from chitin.langchain import ChitinVectorStore, encode_results
+        from chitin.types import Payload, SearchResult
+
+        store = ChitinVectorStore()
+        hit = SearchResult(
+            polyp_id="00000000-0000-0000-0000-000000000000",
+            payload=Payload(content="Mars is red"),
+            similarity=0.9,
+        )
+        monkeypatch.setattr(ChitinClient, "search", lambda self, **kw: [hit])
+        scored = store.similarity_search_with_score("red planet")
+        assert json.loads(encode_results(scored)) == json.loads(json.dumps(scored))
+        store.close()